@@ -162,16 +162,11 @@ import traceback
 
 try:
     import botocore
+    from botocore.config import Config
     HAS_BOTOCORE = True
 except ImportError:
     HAS_BOTOCORE = False
 
-try:
-    import boto3
-except ImportError:
-    # will be caught by imported HAS_BOTO3
-    pass
-
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils.ec2 import (ec2_argument_spec, get_aws_connection_info, boto3_conn,
                                       HAS_BOTO3, camel_dict_to_snake_dict)
@@ -225,7 +220,8 @@ def create_instance(module, client, instance_name):
             module.fail_json(msg='Unable to create instance {0}, error: {1}'.format(instance_name, e))
         changed = True
 
-    inst = _find_instance_info(client, instance_name)
+        # Only fetch again if we created something, otherwise the lookup above is current
+        inst = _find_instance_info(client, instance_name)
 
     return (changed, inst)
 
@@ -410,10 +406,14 @@ def core(module):
     if not region:
         module.fail_json(msg='region must be specified')
 
+    # Allow up to 10 attempts so that many hosts hitting the Lightsail API
+    # at once back off on throttling instead of failing the task outright.
+    boto_core_config = Config(retries={'max_attempts': 9})
+
     client = None
     try:
         client = boto3_conn(module, conn_type='client', resource='lightsail',
-                            region=region, endpoint=ec2_url, **aws_connect_kwargs)
+                            region=region, endpoint=ec2_url, config=boto_core_config, **aws_connect_kwargs)
     except (botocore.exceptions.ClientError, botocore.exceptions.ValidationError) as e:
         module.fail_json(msg='Failed while connecting to the lightsail service: %s' % e, exception=traceback.format_exc())
 
@@ -457,7 +457,8 @@ def main():
         wait_timeout=dict(default=300),
     ))
 
-    module = AnsibleModule(argument_spec=argument_spec)
+    module = AnsibleModule(argument_spec=argument_spec,
+                           required_if=[('state', 'present', ('zone', 'blueprint_id', 'bundle_id'))])
 
     if not HAS_BOTO3:
         module.fail_json(msg='Python module "boto3" is missing, please install it')